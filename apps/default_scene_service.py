@@ -1,5 +1,6 @@
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
 
+import dataclasses
 import datetime
 import enum
 import random
@@ -31,17 +32,20 @@ class Room(enum.Enum):
 
 
 ROOM_NAME_MAPPING = {room.name.lower(): room for room in list(Room)}
+# The plain per-room scenes, built once rather than formatted on every lookup.
+ROOM_DIM_SCENES = {
+    room: Scene(f"{name}_dim") for name, room in ROOM_NAME_MAPPING.items()
+}
+ROOM_BRIGHT_SCENES = {
+    room: Scene(f"{name}_bright") for name, room in ROOM_NAME_MAPPING.items()
+}
 
 
-def get_day_stable_random(seed: int, values: dict[T, int]) -> T:
+def get_day_stable_random(seed: int, values: dict[T, int], day: datetime.date) -> T:
     """Get a random value which is stable throughout a given day for the same given seed."""
-    # Get the timestamp for the start of "today"
+    # Get the timestamp for the start of the day
     today_seed = int(
-        (
-            datetime.datetime.combine(
-                datetime.date.today(), datetime.datetime.min.time()
-            )
-        ).timestamp()
+        (datetime.datetime.combine(day, datetime.datetime.min.time())).timestamp()
     )
     rand = random.Random(today_seed + seed)
 
@@ -53,8 +57,34 @@ def get_day_stable_random(seed: int, values: dict[T, int]) -> T:
     return choices[0]
 
 
-def get_day_stable_random_uniform(seed: int, values: set[T]) -> T:
-    return get_day_stable_random(seed, {x: 1 for x in values})
+def get_day_stable_random_uniform(seed: int, values: set[T], day: datetime.date) -> T:
+    return get_day_stable_random(seed, {x: 1 for x in values}, day)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DefaultSceneRequest:
+    room_names: tuple[str, ...]
+    transition: Optional[int]
+
+    @classmethod
+    def parse(cls, data: Dict[str, Any]) -> "DefaultSceneRequest":
+        """Raises `ValueError` if the event data is malformed."""
+        room_names = data.get("rooms", None)
+        if not isinstance(room_names, list):
+            raise ValueError(
+                f"room names passed to {EVENT_NAME} must be a list, got: {room_names}"
+            )
+        for room_name in room_names:
+            if not isinstance(room_name, str):
+                raise ValueError(
+                    f"room name passed to {EVENT_NAME} must be a str, got: {room_name}"
+                )
+        transition = data.get("transition", None)
+        if transition is not None and not isinstance(transition, int):
+            raise ValueError(
+                f"transition passed to {EVENT_NAME} must be an int, got: {transition}"
+            )
+        return cls(room_names=tuple(room_names), transition=transition)
 
 
 # This can't be a proper service because AppDaemon can't create HA services :( Instead, using the workaround from
@@ -68,14 +98,16 @@ class DefaultSceneService(typed_hass.Hass):
     def _get_boolean_state(self, entity_id: EntityId) -> bool:
         return self.get_state(entity_id=entity_id) == "on"
 
-    def _get_default_scene_for_room(self, room: Room) -> Optional[EntityId]:
-        hour = datetime.datetime.now().hour
+    def _get_default_scene_for_room(
+        self, room: Room, now: datetime.datetime
+    ) -> Optional[EntityId]:
+        hour = now.hour
         keith_awake = self._get_boolean_state(InputBoolean("keith_awake"))
         nighttime_lights_enabled = self._get_boolean_state(
             InputBoolean("nighttime_lights_enabled")
         )
 
-        is_workday = datetime.datetime.now().weekday() < 5 and self._get_boolean_state(
+        is_workday = now.weekday() < 5 and self._get_boolean_state(
             InputBoolean("workday")
         )
 
@@ -84,11 +116,11 @@ class DefaultSceneService(typed_hass.Hass):
         if room is Room.LIVING_ROOM and self._get_boolean_state(
             BinarySensor("octoprint_printing")
         ):
-            return Scene(f"{room.name.lower()}_bright")
+            return ROOM_BRIGHT_SCENES[room]
 
         # In the late evening and early morning, default to dim lights in all rooms.
         if nighttime_lights_enabled and between_hours(hour, 0, 6):
-            return Scene(f"{room.name.lower()}_dim")
+            return ROOM_DIM_SCENES[room]
 
         # In the bedroom, if still in "asleep mode" then always do dim.
         if room is Room.BEDROOM and not keith_awake:
@@ -96,7 +128,7 @@ class DefaultSceneService(typed_hass.Hass):
 
         # Special override for skipping the fancy lights and always being ~bright.
         if self._get_boolean_state(InputBoolean("bright_lights")):
-            return Scene(f"{room.name.lower()}_bright")
+            return ROOM_BRIGHT_SCENES[room]
 
         if room is Room.LIVING_ROOM:
             return get_day_stable_random_uniform(
@@ -109,6 +141,7 @@ class DefaultSceneService(typed_hass.Hass):
                     Scene("living_room_spring_blossom"),
                     Scene("living_room_tropical_twilight"),
                 },
+                now.date(),
             )
         elif room is Room.OFFICE:
             keith_ooo = self._get_boolean_state(BinarySensor("keith_ooo"))
@@ -125,34 +158,37 @@ class DefaultSceneService(typed_hass.Hass):
                     Scene("office_spring_blossom"),
                     Scene("office_tropical_twilight"),
                 },
+                now.date(),
             )
         else:
-            return Scene(f"{room.name.lower()}_bright")
+            return ROOM_BRIGHT_SCENES[room]
 
     def _turn_on_default_scene(self, _event_name: str, data: Dict[str, Any], *_: Any):
-        room_names = data.get("rooms", None)
-        assert isinstance(
-            room_names, list
-        ), f"room names passed to {EVENT_NAME} must be a list, got: {room_names}"
-        transition = data.get("transition", None)
-        assert transition is None or isinstance(
-            transition, int
-        ), f"transition passed to {EVENT_NAME} must be an int, got: {transition}"
+        request = DefaultSceneRequest.parse(data)
 
-        for room_name in room_names:
-            assert isinstance(
-                room_name, str
-            ), f"room name passed to {EVENT_NAME} must be a str, got: {room_name}"
+        # Evaluate every room against the same instant, rather than re-reading the clock per room.
+        now = datetime.datetime.now()
+
+        log_scenes = self.info_log_enabled()
+        scenes = list[EntityId]()
+        # Skip duplicate rooms, keeping the order they were passed in.
+        for room_name in dict.fromkeys(request.room_names):
             room = ROOM_NAME_MAPPING.get(room_name)
             if room is None:
                 continue
-            scene = self._get_default_scene_for_room(room)
-            self.info_log(f"Loading default scene for {room}: {scene}")
+            scene = self._get_default_scene_for_room(room, now)
+            if log_scenes:
+                self.info_log(f"Loading default scene for {room}: {scene}")
             if scene is None:
                 continue
-            # Passing a None transition fails, and I suspect a transition of 0
-            # might be different to "no transition"...
-            optional_transition = (
-                {} if transition is None else {"transition": transition}
-            )
-            self.turn_on(entity_id=scene, **optional_transition)
+            scenes.append(scene)
+
+        if not scenes:
+            return
+        # Passing a None transition fails, and I suspect a transition of 0
+        # might be different to "no transition"...
+        optional_transition = (
+            {} if request.transition is None else {"transition": request.transition}
+        )
+        # Turn all the rooms on in one call, so they change together.
+        self.turn_on(entity_id=scenes, **optional_transition)
@@ -200,9 +200,10 @@ class Room(abc.ABC):
         @wraps(f)
         def inner(self: RoomVar, *args: P.args, **kwargs: P.kwargs):
             if self.manual_control_enabled():
-                self._hass.info_log(
-                    f"Manual control enabled in {self._name}, no action"
-                )
+                if self._hass.info_log_enabled():
+                    self._hass.info_log(
+                        f"Manual control enabled in {self._name}, no action"
+                    )
                 return
             f(self, *args, **kwargs)
 
@@ -214,23 +215,25 @@ class Room(abc.ABC):
 
         inactive_required_sensors = self._get_inactive_required_sensors()
         if inactive_required_sensors:
-            self._hass.info_log(
-                f"motion in {self._name} from {entity_id} but required sensors aren't active: {inactive_required_sensors}"
-            )
+            if self._hass.info_log_enabled():
+                self._hass.info_log(
+                    f"motion in {self._name} from {entity_id} but required sensors aren't active: {inactive_required_sensors}"
+                )
             return
         lights_off = self._are_lights_off()
         # Only load the scene if the lights are off: if the lights are already
         # on, leave them as they are.
         if lights_off or not self._lights_on:
-            self._hass.info_log(
-                f"motion in {self._name} from {entity_id}, turning on lights"
-            )
+            if self._hass.info_log_enabled():
+                self._hass.info_log(
+                    f"motion in {self._name} from {entity_id}, turning on lights"
+                )
             if not self._lights_on:
                 self._hass.warning_log(
                     "edge case: lights were on in HA but off in the model."
                 )
             self._turn_on_lights()
-        else:
+        elif self._hass.info_log_enabled():
             self._hass.info_log(
                 f"motion in {self._name} from {entity_id} but lights already on"
             )
@@ -239,21 +242,24 @@ class Room(abc.ABC):
     def on_room_no_motion(self, *_: Any):
         active_devices = self._get_active_sensors()
         if active_devices:
-            self._hass.info_log(
-                f"no motion in {self._name}, but devices are active: {active_devices}"
-            )
+            if self._hass.info_log_enabled():
+                self._hass.info_log(
+                    f"no motion in {self._name}, but devices are active: {active_devices}"
+                )
             return
 
-        self._hass.info_log(
-            f"no motion in {self._name} for {self._no_motion_timeout}, no devices are active, lights off"
-        )
+        if self._hass.info_log_enabled():
+            self._hass.info_log(
+                f"no motion in {self._name} for {self._no_motion_timeout}, no devices are active, lights off"
+            )
         self._turn_off_lights()
 
     @skip_if_manual_control_enabled
     def on_activity_sensor_change(self, entity: str, *_: Any):
         active_devices = self._get_active_sensors()
         if active_devices:
-            self._hass.info_log(f"active devices remaining: {active_devices}")
+            if self._hass.info_log_enabled():
+                self._hass.info_log(f"active devices remaining: {active_devices}")
             return
 
         # Don't turn the lights off if a device is turned off and there hasn't
@@ -263,13 +269,14 @@ class Room(abc.ABC):
             now - last_motion for last_motion in self._last_motions.values()
         )
         if time_since_last_motion > self._no_motion_timeout:
-            self._hass.info_log(
-                f"no active devices, last was {entity}, last motion was "
-                f"{time_since_last_motion.seconds} ago vs timeout of "
-                f"{self._no_motion_timeout.seconds}, lights off"
-            )
+            if self._hass.info_log_enabled():
+                self._hass.info_log(
+                    f"no active devices, last was {entity}, last motion was "
+                    f"{time_since_last_motion.seconds} ago vs timeout of "
+                    f"{self._no_motion_timeout.seconds}, lights off"
+                )
             self._turn_off_lights()
-        else:
+        elif self._hass.info_log_enabled():
             self._hass.info_log(
                 f"no active devices, last was {entity}, last motion was "
                 f"{time_since_last_motion.seconds} ago vs timeout of "
@@ -2,10 +2,10 @@
 
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
 
-from typing import Any, Optional, NewType, Callable, Literal
-import copy
-import dataclasses
+from typing import Any, Optional, NewType, Callable, Literal, NotRequired, TypedDict
 import datetime
+import functools
+import logging
 
 import appdaemon.plugins.hass.hassapi as hass  # pyright: ignore[reportMissingTypeStubs, reportMissingImports]
 
@@ -13,6 +13,8 @@ EntityId = NewType("EntityId", str)
 
 
 def make_typed_entity_id(prefix: str) -> Callable[[str], EntityId]:
+    # Entity names are a small fixed set, so the cache stays small.
+    @functools.lru_cache(maxsize=256)
     def inner(s: str):
         if "." in s:
             raise ValueError("Argument contains a prefix.")
@@ -42,8 +44,7 @@ EventCallback = Callable[[str, dict[str, Any], dict[str, Any]], None]
 SchedulerCallback = Callable[[dict[str, Any]], None]
 
 
-@dataclasses.dataclass
-class NotifyAction:
+class NotifyAction(TypedDict):
     """https://companion.home-assistant.io/docs/notifications/actionable-notifications/#building-actionable-notifications"""
 
     # Text to show in the notification
@@ -51,7 +52,7 @@ class NotifyAction:
     # Event type to fire in homeassistant
     action: str
     # Semantics of the press.
-    behavior: Literal["textInput"] | None = None
+    behavior: NotRequired[Literal["textInput"]]
 
 
 class Hass(hass.Hass):
@@ -60,6 +61,8 @@ class Hass(hass.Hass):
     def __init__(self, *args: Any, **kwargs: Any):
         self.args: dict[str, str]
         super().__init__(*args, **kwargs)
+        # Callbacks for phone notification actions, keyed by action name.
+        self._notify_action_callbacks = dict[str, EventCallback]()
 
     def get_state(
         self,
@@ -99,11 +102,13 @@ class Hass(hass.Hass):
     def call_service(
         self,
         service: str,
-        entity_id: Optional[EntityId] = None,
+        entity_id: Optional[EntityId | list[EntityId]] = None,
         data: Optional[dict[str, Any]] = None,
         **kwargs: Any,
     ):
-        if entity_id is not None:
+        if isinstance(entity_id, list):
+            kwargs["entity_id"] = [str(e) for e in entity_id]
+        elif entity_id is not None:
             kwargs["entity_id"] = str(entity_id)
         if data is not None:
             kwargs["data"] = data
@@ -115,6 +120,10 @@ class Hass(hass.Hass):
     def info_log(self, message: str):
         super().log(message, level="INFO")
 
+    def info_log_enabled(self) -> bool:
+        """Whether `info_log` messages pass the app's `log_level`, so callers can skip building them."""
+        return self.get_main_log().isEnabledFor(logging.INFO)
+
     def warning_log(self, message: str):
         super().log(message, level="WARNING")
 
@@ -131,7 +140,7 @@ class Hass(hass.Hass):
             message=message,
         )
 
-    def turn_on(self, entity_id: EntityId, **kwargs: Any):
+    def turn_on(self, entity_id: EntityId | list[EntityId], **kwargs: Any):
         self.call_service(
             service="homeassistant/turn_on", entity_id=entity_id, **kwargs
         )
@@ -164,13 +173,11 @@ class Hass(hass.Hass):
         data: dict[str, Any] | None = None,
         actions: list[NotifyAction] | None = None,
     ):
-        if data is None:
-            data = {}
-        else:
-            data = copy.deepcopy(data)
+        """`data` is shallow-copied: nested values are shared with the caller but never mutated."""
+        data = dict(data) if data else {}
 
         if actions is not None:
-            data["actions"] = [dataclasses.asdict(a) for a in actions]
+            data["actions"] = list(actions)
 
         try:
             super().notify(
@@ -188,8 +195,24 @@ class Hass(hass.Hass):
         callback: EventCallback,
         action_name: str,
     ):
-        def c(event_name: str, event_args: dict[str, Any], user_args: dict[str, Any]):
-            if event_args.get("action") == action_name:
-                callback(event_name, event_args, user_args)
+        # Only register a single listener with appdaemon and dispatch by action name,
+        # rather than having every registered callback filter every action event.
+        if not self._notify_action_callbacks:
+            self.listen_event(
+                callback=self._on_notify_phone_action,
+                event="mobile_app_notification_action",
+            )
+        if action_name in self._notify_action_callbacks:
+            raise ValueError(
+                f"A callback is already registered for action '{action_name}'"
+            )
+        self._notify_action_callbacks[action_name] = callback
 
-        self.listen_event(callback=c, event="mobile_app_notification_action")
+    def _on_notify_phone_action(
+        self, event_name: str, event_args: dict[str, Any], user_args: dict[str, Any]
+    ):
+        action = event_args.get("action")
+        if isinstance(action, str) and (
+            callback := self._notify_action_callbacks.get(action)
+        ):
+            callback(event_name, event_args, user_args)
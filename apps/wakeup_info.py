@@ -1,26 +1,29 @@
-from typing import Any, Iterable, Collection
+from typing import Any, Iterable
 
 import dataclasses
 from dataclasses import field
 import datetime
 import json
-import dateutil.parser
+import operator
 import requests
+import requests.adapters
+import time
 import zoneinfo
 
 import typed_hass
 
 TIMEZONE = zoneinfo.ZoneInfo("Europe/London")
+# Reused across fetches so repeated calls keep the connection to tomorrow.io alive.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+)
+# Repeat announcements within this window reuse the last fetched forecast.
+FORECAST_TTL = datetime.timedelta(minutes=30)
 type Hour = int
 
 
-def mean[T](xs: Collection[float], default: T = None) -> float | T:
-    if not xs:
-        return default
-    return sum(xs) / len(xs)
-
-
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ForecastSnapshot:
     precipitation_probability: float | None = field(metadata={"display": "rain %"})
     precipitation_intensity: float | None = field(metadata={"display": "rain str"})
@@ -30,56 +33,66 @@ class ForecastSnapshot:
     uv_index: float | None = field(metadata={"display": "uv index"})
 
 
+SNAPSHOT_FIELD_GETTERS = {
+    f.name: operator.attrgetter(f.name) for f in dataclasses.fields(ForecastSnapshot)
+}
+
+
 class Forecast:
     def __init__(self, data: str):
-        self.days = dict[datetime.date, dict[Hour, ForecastSnapshot]]()
+        self.snapshots = dict[tuple[datetime.date, Hour], ForecastSnapshot]()
         # For "serialisation"/"deserialisation"
         self.data = data
 
         for timeline in json.loads(data)["data"]["timelines"][0]["intervals"]:
-            time = dateutil.parser.parse(timeline["startTime"]).astimezone(TIMEZONE)
-
-            if time.date() not in self.days:
-                self.days[time.date()] = {}
-            self.days[time.date()][time.hour] = ForecastSnapshot(
-                precipitation_probability=timeline["values"].get(
-                    "precipitationProbability"
-                ),
-                precipitation_intensity=timeline["values"].get(
-                    "precipitationIntensity"
-                ),
-                temperature=timeline["values"].get("temperature"),
-                humidity=timeline["values"].get("humidity"),
-                dew_point=timeline["values"].get("dewPoint"),
-                uv_index=timeline["values"].get("uvIndex"),
+            # Python 3.11+ parses any ISO 8601 timestamp, including a "Z" suffix.
+            start_time = datetime.datetime.fromisoformat(
+                timeline["startTime"]
+            ).astimezone(TIMEZONE)
+
+            values = timeline["values"]
+            self.snapshots[(start_time.date(), start_time.hour)] = ForecastSnapshot(
+                precipitation_probability=values.get("precipitationProbability"),
+                precipitation_intensity=values.get("precipitationIntensity"),
+                temperature=values.get("temperature"),
+                humidity=values.get("humidity"),
+                dew_point=values.get("dewPoint"),
+                uv_index=values.get("uvIndex"),
             )
 
-    def _get_value(self, field: str, hour: Hour, day_delta: int) -> float | None:
-        key = datetime.date.today() + datetime.timedelta(days=day_delta)
-        if not (day_info := self.days.get(key)):
-            return None
-        if not (hour_info := day_info.get(hour)):
-            return None
-        return getattr(hour_info, field)
-
-    def _get_values(
-        self, field: str, hours: Iterable[Hour], day_delta: int = 0
-    ) -> list[float]:
-        return [
-            val for hour in hours if (val := self._get_value(field, hour, day_delta))
-        ]
-
-    def precipitation_probability(self, hour: Hour, day_delta: int = 0) -> float | None:
-        return self._get_value("precipitation_probability", hour, day_delta)
-
-    def precipitation_intensity(self, hour: Hour, day_delta: int = 0) -> float | None:
-        return self._get_value("precipitation_intensity", hour, day_delta)
-
-    def temperature(self, hour: Hour, day_delta: int = 0) -> float | None:
-        return self._get_value("temperature", hour, day_delta)
-
-    def temperatures(self, hours: Iterable[Hour], day_delta: int = 0) -> list[float]:
-        return self._get_values("temperature", hours, day_delta)
+    def _get_sum(self, field: str, hours: Iterable[Hour], date: datetime.date) -> float:
+        getter = SNAPSHOT_FIELD_GETTERS[field]
+        total = 0.0
+        for hour in hours:
+            if (snapshot := self.snapshots.get((date, hour))) is None:
+                continue
+            total += getter(snapshot) or 0
+        return total
+
+    def _get_mean(
+        self, field: str, hours: Iterable[Hour], date: datetime.date
+    ) -> float | None:
+        getter = SNAPSHOT_FIELD_GETTERS[field]
+        total = 0.0
+        count = 0
+        for hour in hours:
+            if (snapshot := self.snapshots.get((date, hour))) is None:
+                continue
+            if (val := getter(snapshot)) is None:
+                continue
+            total += val
+            count += 1
+        return total / count if count else None
+
+    def precipitation_probability_sum(
+        self, hours: Iterable[Hour], date: datetime.date
+    ) -> float:
+        return self._get_sum("precipitation_probability", hours, date)
+
+    def mean_temperature(
+        self, hours: Iterable[Hour], date: datetime.date
+    ) -> float | None:
+        return self._get_mean("temperature", hours, date)
 
     def as_table(self) -> str:
         headers = ["day", "hour"] + [
@@ -88,14 +101,11 @@ class Forecast:
         ]
         spacer = ["".ljust(len(h), "-") for h in headers]
         rows = list[list[str]]()
-        for day, hour_forecasts in sorted(self.days.items()):
-            for hour, forecast in sorted(hour_forecasts.items()):
-                row = [str(day.day), str(hour)]
-                for field in dataclasses.fields(forecast):
-                    row.append(str(getattr(forecast, field.name)))
-                rows.append(
-                    [val.ljust(len(header)) for val, header in zip(row, headers)]
-                )
+        for (day, hour), forecast in sorted(self.snapshots.items()):
+            row = [str(day.day), str(hour)]
+            for field in dataclasses.fields(forecast):
+                row.append(str(getattr(forecast, field.name)))
+            rows.append([val.ljust(len(header)) for val, header in zip(row, headers)])
 
         return "\n".join(" | ".join(row) for row in [headers, spacer] + rows)
 
@@ -119,26 +129,15 @@ class WakeupInfo(typed_hass.Hass):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
         self._cache = ForecastCache()
+        # time.monotonic() of the last successful fetch from the API.
+        self._last_fetch_time: float | None = None
 
     def initialize(self):
-        self._cache.load("/tmp/weather_cache")
-        self.listen_event(event="ANNOUNCE_WEATHER", callback=self._on_event)
-        self._on_event("", {"use_cache": True, "print_forecast": True}, {})
-
-    def terminate(self):
-        self._cache.save("/tmp/weather_cache")
-
-    def _fetch_forecast(self, from_cache: bool) -> Forecast:
-        if from_cache and (forecast := self._cache.get(datetime.date.today())):
-            self.info_log(f"Returning cached forecast for {datetime.date.today()}")
-            return forecast
-
-        self.info_log("Fetching weather")
-        response = requests.post(
-            url="https://api.tomorrow.io/v4/timelines",
-            params={"apikey": self.args.get("api_key")},
-            # https://docs.tomorrow.io/reference/post-timelines
-            json={
+        # The request never changes over the app's lifetime, so only build it once.
+        # https://docs.tomorrow.io/reference/post-timelines
+        self._request_params = {"apikey": self.args.get("api_key")}
+        self._request_body = json.dumps(
+            {
                 "location": self.args.get("location"),
                 "units": "metric",
                 # https://docs.tomorrow.io/reference/data-layers-core
@@ -154,13 +153,39 @@ class WakeupInfo(typed_hass.Hass):
                 "timezone": "auto",
                 "startTime": "nowMinus1d",
                 "endTime": "nowPlus1d",
-            },
+            }
+        ).encode()
+        self._cache.load("/tmp/weather_cache")
+        self.listen_event(event="ANNOUNCE_WEATHER", callback=self._on_event)
+        self._on_event("", {"use_cache": True, "print_forecast": True}, {})
+
+    def terminate(self):
+        self._cache.save("/tmp/weather_cache")
+
+    def _fetch_forecast(self, today: datetime.date, from_cache: bool) -> Forecast:
+        recently_fetched = (
+            self._last_fetch_time is not None
+            and time.monotonic() - self._last_fetch_time <= FORECAST_TTL.total_seconds()
+        )
+        if (from_cache or recently_fetched) and (forecast := self._cache.get(today)):
+            self.info_log(f"Returning cached forecast for {today}")
+            return forecast
+
+        self.info_log("Fetching weather")
+        response = _SESSION.post(
+            url="https://api.tomorrow.io/v4/timelines",
+            params=self._request_params,
+            data=self._request_body,
+            headers={"Content-Type": "application/json"},
+            # (connect, read): don't let a stalled connection hang the callback thread.
+            timeout=(3.05, 10),
         )
         self.info_log("Fetched weather")
         if response.status_code != 200:
             raise RuntimeError(f"{response.status_code}: {response.text}")
         forecast = Forecast(response.text)
-        self._cache[datetime.date.today()] = forecast
+        self._cache[today] = forecast
+        self._last_fetch_time = time.monotonic()
         return forecast
 
     def _on_event(
@@ -169,24 +194,26 @@ class WakeupInfo(typed_hass.Hass):
         use_cache = data.get("use_cache", False)
         print_forecast = data.get("print_forecast", False)
 
-        forecast = self._fetch_forecast(from_cache=use_cache)
+        # Read the clock once so every lookup agrees on what "today" is.
+        today = datetime.datetime.now(TIMEZONE).date()
+        yesterday = today - datetime.timedelta(days=1)
+
+        forecast = self._fetch_forecast(today, from_cache=use_cache)
         if print_forecast:
             print(forecast.as_table())
 
         messages = list[str]()
-        if datetime.datetime.today().weekday() <= 5:
+        if today.weekday() < 5:
             # On workdays, warn about rain only during commute times.
-            rain_chances = {
-                hour: forecast.precipitation_probability(hour=hour)
-                for hour in [9, 10, 18, 19]
-            }
-            morning_rain_chance = (rain_chances.get(9) or 0) + (
-                rain_chances.get(10) or 0
+            morning_rain_chance = forecast.precipitation_probability_sum(
+                hours=(9, 10), date=today
+            )
+            evening_rain_chance = forecast.precipitation_probability_sum(
+                hours=(18, 19), date=today
             )
-            evening_rain_chance = (rain_chances.get(18) or 0) + (
-                rain_chances.get(19) or 0
+            self.info_log(
+                f"rain chances: morning {morning_rain_chance}, evening {evening_rain_chance}"
             )
-            self.info_log(f"rain chances: {rain_chances}")
             if morning_rain_chance > 0:
                 messages.append("It'll rain in the morning.")
             if evening_rain_chance > 0:
@@ -196,9 +223,9 @@ class WakeupInfo(typed_hass.Hass):
             # TODO
             pass
 
-        today_mean_temp = mean(forecast.temperatures(hours=range(9, 18)))
-        yesterday_mean_temp = mean(
-            forecast.temperatures(hours=range(9, 18), day_delta=-1)
+        today_mean_temp = forecast.mean_temperature(hours=range(9, 18), date=today)
+        yesterday_mean_temp = forecast.mean_temperature(
+            hours=range(9, 18), date=yesterday
         )
         self.info_log(
             f"today mean temp: {today_mean_temp}, yesterday mean temp: {yesterday_mean_temp}"
@@ -10,6 +10,8 @@ BEDROOM_SENSORS = [
     BinarySensor("bedroom_entrance_motion_occupancy"),
 ]
 SHOWER_ACTIVE = InputBoolean("shower_active")
+# How long after a shower bedroom motion should trigger the reminder.
+REMINDER_WINDOW = TimeDelta(minutes=60)
 
 
 def _next_morning(d: SystemDateTime) -> SystemDateTime:
@@ -36,7 +38,7 @@ class WeightReminder(typed_hass.Hass):
             return
 
         now = SystemDateTime.now()
-        recent_after_shower = now < self._last_shower_on + TimeDelta(minutes=60)
+        recent_after_shower = now < self._last_shower_on + REMINDER_WINDOW
         havent_reminded_today = now >= _next_morning(self._last_reminder)
         if recent_after_shower and havent_reminded_today:
             self._last_reminder = now
@@ -1,15 +1,19 @@
 from typing import Any, NewType, Self, Callable
 import abc
 import dataclasses
-import datetime
 import typed_hass
-import re
 import json
+import os
 import pathlib
 import threading
+import time
 
 ACTION_NAME = "WIFI_DEVICE_REMEMBER"
-INTERNAL_IP_REGEX = re.compile(r"^(10|192\.168|172)\..*")
+INTERNAL_IP_PREFIXES = ("10.", "192.168.", "172.")
+# Minimum time between notifications about the same device.
+NOTIFY_INTERVAL_S = 60 * 60
+# Registry edits within this many seconds of each other are written in one save.
+REGISTRY_SAVE_DELAY_S = 5
 # This resolves to a path outside the docker container, on the host filesystem.
 REGISTRY_PATH = pathlib.Path("/conf/wifi_device_registry.json")
 OUI_PATH = pathlib.Path("/conf/oui_snapshot.json")
@@ -25,13 +29,14 @@ class OuiLookup:
     def __init__(self, lookup: dict[str, CompanyName]):
         # Keyed by MAC prefix
         self._lookup = lookup
+        # Only a few prefix lengths occur in practice (e.g. /24 OUIs), so only try
+        # those, longest (most specific) first.
+        self._prefix_lengths = sorted({len(p) for p in lookup}, reverse=True)
 
     def identify(self, mac: Mac) -> CompanyName | None:
-        m = str(mac)
-        while len(m) > 0:
-            if (company_name := self._lookup.get(m)) is not None:
+        for length in self._prefix_lengths:
+            if (company_name := self._lookup.get(mac[:length])) is not None:
                 return company_name
-            m = m[:-3]  # Strip the last `:XX`
         return None
 
     @classmethod
@@ -45,7 +50,9 @@ class OuiLookup:
 @dataclasses.dataclass(frozen=True)
 class Serialisable(abc.ABC):
     def serialise(self) -> str:
-        return json.dumps(dataclasses.asdict(self), indent=2)
+        # Fields are all JSON-safe already, so skip the recursive copy `asdict` makes.
+        fields = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        return json.dumps(fields, separators=(",", ":"))
 
     @classmethod
     def deserialise(cls, s: str) -> Self:
@@ -70,7 +77,7 @@ class DeviceTracker(Serialisable):
             attributes.get("source_type") != "router"
             or not isinstance(mac, str)
             or not isinstance(ip, str)
-            or INTERNAL_IP_REGEX.match(ip) is None
+            or not ip.startswith(INTERNAL_IP_PREFIXES)
         ):
             return None
         return DeviceTracker(
@@ -99,16 +106,26 @@ class DeviceRegistry(Serialisable):
             return None
 
     def save(self, on_fail: Callable[[], None]):
-        old = self.load()
-        new = self.serialise()
-        if old is not None and len(old.serialise()) > len(new):
-            on_fail()
-            raise RuntimeError(
-                "Tried to reduce size of wifi device registry, probably a bug."
-                " Crashing to prevent data loss."
-                f"Old:\n{old}\nNew:\n{self}"
-            )
-        REGISTRY_PATH.write_text(new)
+        new = self.serialise().encode()
+        try:
+            saved_size = REGISTRY_PATH.stat().st_size
+        except FileNotFoundError:
+            saved_size = 0
+        # Only pay for loading and re-serialising the old registry if the file on
+        # disk is bigger than what's about to replace it.
+        if saved_size > len(new):
+            old = self.load()
+            if old is not None and len(old.serialise().encode()) > len(new):
+                on_fail()
+                raise RuntimeError(
+                    "Tried to reduce size of wifi device registry, probably a bug."
+                    " Crashing to prevent data loss."
+                    f"Old:\n{old}\nNew:\n{self}"
+                )
+        # Write then rename, so a crash mid-write can't leave a truncated registry.
+        tmp_path = REGISTRY_PATH.with_suffix(".json.tmp")
+        tmp_path.write_bytes(new)
+        os.replace(tmp_path, REGISTRY_PATH)
 
 
 class WifiDevices(typed_hass.Hass):
@@ -116,8 +133,12 @@ class WifiDevices(typed_hass.Hass):
         super().__init__(*args, **kwargs)
         self._device_registry = DeviceRegistry(macs={})
         self._device_registry_lock = threading.Lock()
+        # Both guarded by `_device_registry_lock`.
+        self._device_registry_dirty = False
+        self._device_registry_save_scheduled = False
 
-        self._last_notified_time = dict[typed_hass.EntityId, datetime.datetime]()
+        # Monotonic timestamps, in seconds.
+        self._last_notified_time = dict[typed_hass.EntityId, float]()
 
     def initialize(self):
         self._oui_lookup = OuiLookup.load()
@@ -147,24 +168,30 @@ class WifiDevices(typed_hass.Hass):
             self.error_log(f"Failed to save on termination: {e}")
 
     def update(self, _):
+        # Snapshot the registry so the lock isn't held while filtering.
+        with self._device_registry_lock:
+            known_macs = set(self._device_registry.macs)
+        # Filter to only relevant new devices. Most devices are already known, so
+        # check the raw MAC before doing the work of building a tracker.
         trackers = [
             t
             for e, s in self.get_tracker_details().items()
-            if (t := DeviceTracker.new(e, s)) is not None
+            if s.get("attributes", {}).get("mac") not in known_macs
+            and (t := DeviceTracker.new(e, s)) is not None
         ]
-        # Filter to only relevant new devices
-        with self._device_registry_lock:
-            trackers = [t for t in trackers if not self._device_registry.contains(t)]
 
-        if not trackers:
-            return
+        now = time.monotonic()
+        # Entries past the interval no longer rate limit anything, so drop them to
+        # stop devices that have since been registered or left from piling up.
+        self._last_notified_time = {
+            e: t
+            for e, t in self._last_notified_time.items()
+            if now - t <= NOTIFY_INTERVAL_S
+        }
 
         for tracker in trackers:
             # Rate limit notifications per entity
-            last_notified = self._last_notified_time.get(
-                tracker.entity_id, datetime.datetime.min
-            )
-            if datetime.datetime.now() - last_notified <= datetime.timedelta(hours=1):
+            if tracker.entity_id in self._last_notified_time:
                 continue
 
             message_lines = {
@@ -181,7 +208,7 @@ class WifiDevices(typed_hass.Hass):
                 f"- {f}: {v}" for f, v in message_lines.items() if v is not None
             )
 
-            self._last_notified_time[tracker.entity_id] = datetime.datetime.now()
+            self._last_notified_time[tracker.entity_id] = now
             self.info_log(f"Sending notification for new device {tracker.entity_id}")
             self.notify_phone(
                 title="Unknown device connected to wifi",
@@ -209,9 +236,21 @@ class WifiDevices(typed_hass.Hass):
         self.info_log(f"Remembering {tracker} as {friendly_name}")
         with self._device_registry_lock:
             self._device_registry.add(tracker, friendly_name)
-            # Could batch saves but realistically they'll be entered slowly and infrequently enough
-            # for it not to matter.
+            self._device_registry_dirty = True
+            if not self._device_registry_save_scheduled:
+                self._device_registry_save_scheduled = True
+                self.run_in(
+                    callback=self._save_device_registry,
+                    after_seconds=REGISTRY_SAVE_DELAY_S,
+                )
+
+    def _save_device_registry(self, _):
+        with self._device_registry_lock:
+            self._device_registry_save_scheduled = False
+            if not self._device_registry_dirty:
+                return
             self._device_registry.save(on_fail=self._on_save_fail)
+            self._device_registry_dirty = False
 
     def _on_save_fail(self):
         self.notify_phone(
@@ -4,6 +4,7 @@
 
 import abc
 import enum
+import itertools
 from typing import Any, Dict, Optional, cast
 
 import appdaemon.plugins.hass.hassapi as hass  # pyright: ignore[reportMissingTypeStubs]
@@ -21,6 +22,11 @@ class ButtonPress(enum.Enum):
     HOLD = enum.auto()
 
 
+PRESS_NAME_MAPPING = {press.name: press for press in ButtonPress}
+# Name used for each press in fired events.
+PRESS_EVENT_NAMES = {press: press.name.lower() for press in ButtonPress}
+
+
 class Button(abc.ABC):
     def __init__(self, name: str):
         self.name = name
@@ -38,7 +44,7 @@ def button_click_to_event_kwargs(
     return {
         "device": device.name,
         "button": button,
-        "press": press.name.lower(),
+        "press": PRESS_EVENT_NAMES[press],
     }
 
 
@@ -51,14 +57,8 @@ def button_click_from_event_kwargs(
     if device_name is None or button is None or press_name is None:
         return None
 
-    press = next(
-        (press for press in ButtonPress if press.name == press_name.upper()),
-        None,
-    )
-    device = next(
-        (device for device in DEVICE_MAPPING.values() if device.name == device_name),
-        None,
-    )
+    press = PRESS_NAME_MAPPING.get(press_name.upper())
+    device = DEVICE_NAME_MAPPING.get(device_name)
     if press is None or device is None:
         return None
     return (device, button, press)
@@ -85,30 +85,32 @@ class IkeaRemote(Button):
         "move": ButtonPress.HOLD,  # bottom button
         "hold": ButtonPress.HOLD,  # left and right buttons
     }
+    # Every combination of the above, so a press is resolved in a single lookup.
+    COMMAND_ARGS_MAPPING: dict[tuple[str, tuple[int, ...]], tuple[str, ButtonPress]] = {
+        (command, args): (button, press)
+        for (command, press), (args, button) in itertools.product(
+            COMMAND_PRESS_MAPPING.items(), ARGS_BUTTON_MAPPING.items()
+        )
+    }
 
     def get_press_info(
         self, command: str, args: tuple[int, ...]
     ) -> Optional[tuple[ButtonName, ButtonPress]]:
-        button = self.ARGS_BUTTON_MAPPING.get(args)
-        if button is None:
-            return None
-        press = self.COMMAND_PRESS_MAPPING.get(command)
-        if press is None:
-            return None
-        return (button, press)
+        return self.COMMAND_ARGS_MAPPING.get((command, args))
 
 
 class IkeaDimmer(Button):
+    COMMAND_ARGS_MAPPING: dict[tuple[str, tuple[int, ...]], tuple[str, ButtonPress]] = {
+        ("on", ()): ("top", ButtonPress.SINGLE),
+        ("off", ()): ("bottom", ButtonPress.SINGLE),
+        ("move_with_on_off", (0, 83)): ("top", ButtonPress.HOLD),
+        ("move", (1, 83, 0, 0)): ("bottom", ButtonPress.HOLD),
+    }
+
     def get_press_info(
         self, command: str, args: tuple[int, ...]
     ) -> Optional[tuple[ButtonName, ButtonPress]]:
-        mapping: dict[tuple[str, tuple[int, ...]], tuple[str, ButtonPress]] = {
-            ("on", ()): ("top", ButtonPress.SINGLE),
-            ("off", ()): ("bottom", ButtonPress.SINGLE),
-            ("move_with_on_off", (0, 83)): ("top", ButtonPress.HOLD),
-            ("move", (1, 83, 0, 0)): ("bottom", ButtonPress.HOLD),
-        }
-        return mapping.get((command, args))
+        return self.COMMAND_ARGS_MAPPING.get((command, args))
 
 
 DEVICE_MAPPING: Dict[str, Button] = {
@@ -123,6 +125,7 @@ IGNORED_DEVICES = {
     "7e6a3bfe790bd210b5ba861198846305",
 }
 assert not IGNORED_DEVICES.issubset(DEVICE_MAPPING.keys())
+DEVICE_NAME_MAPPING = {device.name: device for device in DEVICE_MAPPING.values()}
 
 
 class ZhaButtonEvents(hass.Hass):
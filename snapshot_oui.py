@@ -7,23 +7,52 @@ so this function is intended to be called manually from a REPL to generate a sna
 ```shell
 $ python3 snapshot_oui.py
 ```
+
+A snapshot less than a week old is kept as-is; delete it to force a refresh.
 """
 
 import pathlib
 import subprocess
 import json
 import re
+import sys
+import time
 
 OUI_PATH = pathlib.Path("oui_snapshot.json")
+# The OUI listing changes slowly, so don't re-download it more often than this.
+MAX_SNAPSHOT_AGE_S = 7 * 24 * 60 * 60
 
-text = subprocess.check_output(["curl", "https://standards-oui.ieee.org"])
+if OUI_PATH.exists():
+    age_s = time.time() - OUI_PATH.stat().st_mtime
+    if age_s < MAX_SNAPSHOT_AGE_S:
+        print(f"{OUI_PATH} is only {age_s / 3600:.1f} hours old, not refreshing it.")
+        sys.exit(0)
 
 # Looking for lines like:
 # 00-62-0B   (hex)		Broadcom Limited
+# Every entry is exactly three hex octets, so match that directly.
 OUI_REGEX = re.compile(
-    r"^((?:[0-9a-zA-Z]{2}-)*[0-9a-zA-Z]{2})\s*\(hex\)\s*(.*)", flags=re.MULTILINE
+    rb"^([0-9A-Fa-f]{2}-[0-9A-Fa-f]{2}-[0-9A-Fa-f]{2})\s+\(hex\)\s+(.*?)\s*$"
 )
+
+DASH_TO_COLON = bytes.maketrans(b"-", b":")
+
 result = dict[str, str]()
-for match in OUI_REGEX.finditer(text.decode()):
-    result[match[1].strip().replace("-", ":")] = match[2].strip()
-OUI_PATH.write_text(json.dumps(result))
+# Match the listing line by line as curl streams it, rather than buffering and
+# decoding the whole thing first. Only the matched fields get decoded.
+with subprocess.Popen(
+    # `-f` makes HTTP errors exit non-zero instead of writing the error page.
+    ["curl", "-f", "https://standards-oui.ieee.org"],
+    stdout=subprocess.PIPE,
+) as curl:
+    assert curl.stdout is not None
+    for line in curl.stdout:
+        if (match := OUI_REGEX.match(line)) is not None:
+            result[match[1].translate(DASH_TO_COLON).decode()] = match[2].decode()
+if curl.returncode != 0:
+    raise subprocess.CalledProcessError(curl.returncode, curl.args)
+# Don't replace a good snapshot with an empty one: it would look fresh and stop
+# any refresh for a week.
+if not result:
+    raise RuntimeError("No OUI entries found in the downloaded listing.")
+OUI_PATH.write_text(json.dumps(result, separators=(",", ":")))